@@ -2,10 +2,10 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-"""Charmed Machine Operator for Apache Kafka Connect."""
+"""Charmed Kubernetes Operator for Apache Kafka Connect."""
 
-import datetime
 import logging
+from datetime import datetime
 
 import ops
 from charms.data_platform_libs.v0.data_models import TypedCharmBase
@@ -21,21 +21,27 @@ from ops import (
     StartEvent,
     StatusBase,
 )
+from tenacity import (
+    Retrying,
+    retry_if_result,
+    stop_before_delay,
+    wait_exponential,
+)
 
 from core.models import Context
 from core.structured_config import CharmConfig
 from events.connect import ConnectHandler
 from events.kafka import KafkaHandler
 from events.tls import TLSHandler
-from events.upgrade import ConnectDependencyModel, ConnectUpgrade
+from events.upgrade import CONNECT_DEPENDENCY_MODEL, ConnectUpgrade
 from events.user_secrets import SecretsHandler
 from literals import (
     CHARM_KEY,
     CONTAINER,
-    DEPENDENCIES,
     JMX_EXPORTER_PORT,
     METRICS_RULES_DIR,
     PLUGIN_RESOURCE_KEY,
+    STATUS_OBJECTS,
     SUBSTRATE,
     LogLevel,
     Status,
@@ -59,7 +65,8 @@ class ConnectCharm(TypedCharmBase[CharmConfig]):
         super().__init__(*args)
         self.name = CHARM_KEY
         self.substrate: Substrates = SUBSTRATE
-        self.pending_inactive_statuses: list[Status] = []
+        # a dict rather than a set, to deduplicate while keeping the order statuses were set in
+        self.pending_inactive_statuses: dict[Status, None] = {}
 
         self.workload = Workload(
             container=self.unit.get_container(CONTAINER), profile=self.config.profile
@@ -89,13 +96,13 @@ class ConnectCharm(TypedCharmBase[CharmConfig]):
         self.upgrade = ConnectUpgrade(
             self,
             substrate=self.substrate,
-            dependency_model=ConnectDependencyModel(
-                **DEPENDENCIES  # pyright: ignore[reportArgumentType]
-            ),
+            dependency_model=CONNECT_DEPENDENCY_MODEL,
         )
 
         self.user_secrets = SecretsHandler(self)
 
+        # NOTE: library handlers register their observers on construction, so they can't be
+        # instantiated lazily without missing the events of the current hook.
         self.restart = RollingOpsManager(self, relation="restart", callback=self._restart_callback)
 
         self.metrics_endpoint = MetricsEndpointProvider(
@@ -147,13 +154,13 @@ class ConnectCharm(TypedCharmBase[CharmConfig]):
         log_level: LogLevel = key.value.log_level
 
         getattr(logger, log_level.lower())(status.message)
-        self.pending_inactive_statuses.append(key)
+        self.pending_inactive_statuses[key] = None
 
     def _on_collect_status(self, event: CollectStatusEvent):
         """Handler for `collect-status` event."""
         workload_status = Status.INSTALLING if not self.workload.installed else self.context.status
-        for status in self.pending_inactive_statuses + [workload_status]:
-            event.add_status(status.value.status)
+        for status in [*self.pending_inactive_statuses, workload_status]:
+            event.add_status(STATUS_OBJECTS[status])
 
     def _restart_callback(self, event: EventBase) -> None:
         """Handler for `rolling_ops` restart events."""
@@ -162,11 +169,20 @@ class ConnectCharm(TypedCharmBase[CharmConfig]):
 
         self.connect_manager.restart_worker()
 
-        for _ in range(4):
-            # shouldn't take longer than a minute
-            if self.connect_manager.health_check():
-                self.context.worker_unit.should_restart = False
-                return
+        # health_check itself makes up to 5 pings 3s apart, with a 2s timeout each, so a call
+        # takes up to ~22s. No call starts after 38s, which bounds the whole wait to a minute
+        healthy = Retrying(
+            wait=wait_exponential(multiplier=1, max=15),
+            stop=stop_before_delay(38),
+            retry=retry_if_result(lambda result: result is False),
+            retry_error_callback=lambda _: False,
+        )(self.connect_manager.health_check)
+
+        if not healthy:
+            logger.warning("Worker service is not healthy after restart.")
+            return
+
+        self.context.worker_unit.should_restart = False
 
     def reconcile(self) -> None:
         """Substrate-agnostic method for startup/restarts/config-changes which orchestrates workload, managers and handlers.
@@ -194,7 +210,7 @@ class ConnectCharm(TypedCharmBase[CharmConfig]):
             unit_tls_context = self.context.worker_unit.tls
             self.tls.certificates.on.certificate_expiring.emit(
                 certificate=unit_tls_context.certificate,
-                expiry=datetime.datetime.now().isoformat(),
+                expiry=datetime.now().isoformat(),
             )
             self.context.worker_unit.update(
                 {unit_tls_context.CERT: ""}
@@ -202,10 +218,17 @@ class ConnectCharm(TypedCharmBase[CharmConfig]):
 
             return  # config-changed would be eventually fired on certificate-available, so no need to defer.
 
-        current_config = set(self.workload.read(self.workload.paths.worker_properties))
-        diff = set(self.config_manager.properties) ^ current_config
+        properties_hash = self.config_manager.properties_hash
+        # the hash outlives the container, a re-created pod has it but no rendered config
+        if (
+            self.context.worker_unit.config_hash != properties_hash
+            or not self.workload.container.exists(self.workload.paths.worker_properties)
+        ):
+            if self.config.profile == "testing":
+                current_config = self.workload.read_set(self.workload.paths.worker_properties)
+                diff = set(self.config_manager.properties) ^ current_config
+                logger.debug(f"Worker properties changed: {diff}")
 
-        if diff:
             self.context.worker_unit.should_restart = True
 
         if not self.context.worker_unit.should_restart:
@@ -218,6 +241,7 @@ class ConnectCharm(TypedCharmBase[CharmConfig]):
         self.connect.enable_auth()
         self.tls_manager.configure()
         self.config_manager.configure()
+        self.context.worker_unit.config_hash = properties_hash
 
         self.on[f"{self.restart.name}"].acquire_lock.emit()
 
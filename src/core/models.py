@@ -81,10 +81,9 @@ class RelationContext(WithStatus):
 
     def update(self, items: dict[str, str]) -> None:
         """Writes to relation_data."""
-        delete_fields = [key for key in items if not items[key]]
-        update_content = {k: items[k] for k in items if k not in delete_fields}
+        update_content = {key: value for key, value in items.items() if value}
         self.relation_data.update(update_content)
-        for field in delete_fields:
+        for field in items.keys() - update_content.keys():
             del self.relation_data[field]
 
     def _fetch_from_secrets(self, field) -> str:
@@ -355,6 +354,21 @@ class WorkerUnitContext(RelationContext):
         _val = "true" if value else "false"
         self.update({"restart": _val})
 
+    @property
+    def config_hash(self) -> str:
+        """Hash of the worker properties last rendered on this unit."""
+        if not self.relation:
+            return ""
+
+        return self.relation_data.get("config-hash", "")
+
+    @config_hash.setter
+    def config_hash(self, value: str) -> None:
+        if not self.relation:
+            return
+
+        self.update({"config-hash": value})
+
     @property
     @override
     def status(self) -> Status:
@@ -129,6 +129,17 @@ class WorkloadBase(ABC):
         """
         ...
 
+    def read_set(self, path: str) -> set[str]:
+        """Reads a file from the workload as a set of unique lines.
+
+        Args:
+            path: the full filepath to read from
+
+        Returns:
+            Set of string lines from the specified path
+        """
+        return set(self.read(path))
+
     @abstractmethod
     def write(self, content: str | BinaryIO, path: str, mode: str = "w") -> None:
         """Writes content to a workload file.
@@ -182,8 +193,8 @@ class WorkloadBase(ABC):
         ...
 
     @abstractmethod
-    def remove(self, path: str, glob: bool = False) -> None:
-        """Removes the file at the provided path."""
+    def remove(self, *paths: str, glob: bool = False) -> None:
+        """Removes the files at the provided paths in a single operation."""
         ...
 
     @abstractmethod
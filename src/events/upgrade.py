@@ -4,6 +4,7 @@
 """Manager for handling Connect in-place upgrades."""
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from charms.data_platform_libs.v0.upgrade import (
@@ -19,6 +20,8 @@ from lightkube.resources.apps_v1 import StatefulSet
 from pydantic import BaseModel
 from typing_extensions import override
 
+from literals import DEPENDENCIES
+
 if TYPE_CHECKING:
     from charm import ConnectCharm
 
@@ -36,6 +39,11 @@ class ConnectDependencyModel(BaseModel):
     connect_service: DependencyModel
 
 
+CONNECT_DEPENDENCY_MODEL = ConnectDependencyModel(
+    **DEPENDENCIES  # pyright: ignore[reportArgumentType]
+)
+
+
 class ConnectUpgrade(DataUpgrade):
     """Implementation of :class:`DataUpgrade` overrides for in-place upgrades."""
 
@@ -86,6 +94,11 @@ class ConnectUpgrade(DataUpgrade):
         """
         return not bool(self.upgrade_stack)
 
+    @cached_property
+    def _k8s_client(self) -> Client:
+        """Kubernetes API client, built once per hook."""
+        return Client()
+
     @property
     def current_version(self) -> str:
         """Get current Kafka version."""
@@ -113,7 +126,7 @@ class ConnectUpgrade(DataUpgrade):
         """Set the rolling update partition to a specific value."""
         try:
             patch = {"spec": {"updateStrategy": {"rollingUpdate": {"partition": partition}}}}
-            Client().patch(  # pyright: ignore [reportArgumentType]
+            self._k8s_client.patch(  # pyright: ignore [reportArgumentType]
                 StatefulSet,
                 name=self.charm.model.app.name,
                 namespace=self.charm.model.name,
@@ -85,6 +85,9 @@ class Status(Enum):
     ACTIVE = StatusLevel(ActiveStatus(), "DEBUG")
 
 
+STATUS_OBJECTS: dict[Status, StatusBase] = {status: status.value.status for status in Status}
+
+
 DEPENDENCIES = {
     "connect_service": {
         "dependencies": {},  # do not need to check Kafka, backwards compatible since 0.10
@@ -4,6 +4,7 @@
 
 """Manager for handling Kafka Connect configuration."""
 
+import hashlib
 import inspect
 import logging
 import os
@@ -257,3 +258,8 @@ class ConfigManager:
         )
 
         return properties
+
+    @property
+    def properties_hash(self) -> str:
+        """Returns a digest of all Kafka Connect properties, independent of their ordering."""
+        return hashlib.sha256("\n".join(sorted(set(self.properties))).encode()).hexdigest()
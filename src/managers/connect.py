@@ -246,16 +246,18 @@ class ConnectManager:
 
     def connector_status(self, relation_id: int) -> TaskStatus:
         """Returns the managed connector status for given `relation_id`."""
+        pattern = self._managed_connector_regex(relation_id)
         for connector, status in self.connectors.items():
-            if re.match(self._managed_connector_regex(relation_id), connector):
+            if pattern.match(connector):
                 return status
 
         return TaskStatus.UNKNOWN
 
     def delete_connector(self, relation_id: int) -> None:
         """Deletes the managed connector instance for given `relation_id`."""
+        pattern = self._managed_connector_regex(relation_id)
         for connector, _ in self.connectors.items():
-            if not re.match(self._managed_connector_regex(relation_id), connector):
+            if not pattern.match(connector):
                 continue
 
             resp = self._request("DELETE", f"connectors/{connector}")
@@ -264,8 +264,13 @@ class TLSManager:
 
     def remove_stores(self) -> None:
         """Cleans up all keys/certs/stores on a unit."""
-        for pattern in ["*.pem", "*.key", "*.p12", "*.jks"]:
-            self.workload.remove(f"{self.workload.paths.config_dir}/{pattern}", glob=True)
+        self.workload.remove(
+            *[
+                f"{self.workload.paths.config_dir}/{pattern}"
+                for pattern in ["*.pem", "*.key", "*.p12", "*.jks"]
+            ],
+            glob=True,
+        )
 
     def configure(self) -> None:
         """Writes all necessary files and makes all required configuration for TLS manager."""
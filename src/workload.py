@@ -4,11 +4,13 @@
 
 """Kafka Connect workload class and methods."""
 
-import fnmatch
 import logging
 import os
+import re
+import shlex
 import socket
 from contextlib import closing
+from functools import cached_property
 from typing import BinaryIO, Iterable
 
 from ops import Container, pebble
@@ -28,6 +30,9 @@ from literals import (
 
 logger = logging.getLogger(__name__)
 
+# allowed characters for a glob pattern passed to the shell
+GLOB_PATTERN_REGEX = re.compile(r"[\w.\-*?\[\]]+")
+
 
 class K8sPaths(Paths):
     """Object to store common paths for Kafka Connect worker in K8s environment."""
@@ -54,10 +59,11 @@ class Workload(WorkloadBase):
     def __init__(self, container: Container, profile: str = "production") -> None:
         self.container = container
         self.log_sensitive_output = profile == "testing"
+        self._read_cache: dict[str, list[str]] = {}
 
     @override
     def start(self) -> None:
-        self.container.add_layer(CHARM_KEY, self.layer, combine=True)
+        self.container.add_layer(CHARM_KEY, self._layer_yaml, combine=True)
         self.container.restart(self.service)
 
     @override
@@ -70,16 +76,27 @@ class Workload(WorkloadBase):
 
     @override
     def read(self, path: str) -> list[str]:
-        if not self.container.exists(path):
-            return []
-        else:
+        if path not in self._read_cache:
+            self._read_cache[path] = self._read(path)
+
+        return list(self._read_cache[path])
+
+    def _read(self, path: str) -> list[str]:
+        """Reads a file from the container, bypassing the read cache."""
+        try:
             with self.container.pull(path) as f:
-                content = f.read().split("\n")
+                content = f.read().splitlines()
+        except pebble.PathError as e:
+            if e.kind != "not-found":
+                raise e
+
+            return []
 
         return content
 
     @override
     def write(self, content: str | BinaryIO, path: str, mode: str = "w") -> None:
+        self._read_cache.pop(path, None)
         self.container.push(path, content, make_dirs=True)
 
     @override
@@ -92,6 +109,8 @@ class Workload(WorkloadBase):
     ) -> str:
         should_log = not sensitive or self.log_sensitive_output
         command = command if isinstance(command, list) else [command]
+        # any command could mutate files on the container, drop everything read so far
+        self.invalidate_cache()
         try:
             process = self.container.exec(
                 command=command,
@@ -106,6 +125,14 @@ class Workload(WorkloadBase):
                 logger.debug(e)
             raise e
 
+    def invalidate_cache(self, path: str | None = None) -> None:
+        """Drops cached file contents for `path`, or for all files if `path` is not provided."""
+        if path is None:
+            self._read_cache.clear()
+            return
+
+        self._read_cache.pop(path, None)
+
     @override
     @retry(
         wait=wait_fixed(1),
@@ -152,15 +179,26 @@ class Workload(WorkloadBase):
         self.exec(["rm", "-r", path])
 
     @override
-    def remove(self, path: str, glob: bool = False) -> None:
+    def remove(self, *paths: str, glob: bool = False) -> None:
         if not glob:
-            self.exec(["rm", path])
+            self.exec(["rm", *paths])
             return
 
-        dirname = os.path.dirname(path)
-        for file in self.container.list_files(dirname):
-            if fnmatch.fnmatch(file.path, path):
-                self.exec(["rm", "-rf", file.path])
+        targets = []
+        for path in paths:
+            dirname, pattern = os.path.split(path)
+            # an empty or relative dirname would resolve against the exec's working directory
+            if not os.path.isabs(dirname) or dirname == "/":
+                raise ValueError(f"Glob removal needs an absolute, non-root directory: {path}")
+
+            if not GLOB_PATTERN_REGEX.fullmatch(pattern):
+                raise ValueError(f"Unsafe glob pattern: {pattern}")
+
+            targets.append(f"{shlex.quote(dirname)}/{pattern}")
+
+        # let the shell expand the patterns, dirnames are quoted to prevent injection.
+        # NOTE: unlike fnmatch, shell globs like `*` do not match dotfiles
+        self.exec(["sh", "-c", f"rm -rf -- {' '.join(targets)}"])
 
     @override
     def dir_exists(self, path: str) -> bool:
@@ -210,10 +248,10 @@ class Workload(WorkloadBase):
     def container_can_connect(self) -> bool:
         return self.container.can_connect()
 
-    @property
+    @cached_property
     @override
     def layer(self) -> pebble.Layer:
-        """Returns a Pebble configuration layer for Kafka Connect."""
+        """Returns a Pebble configuration layer for Kafka Connect, built once per workload instance."""
         extra_opts = [
             f"-javaagent:{self.paths.jmx_prometheus_javaagent}={JMX_EXPORTER_PORT}:{self.paths.jmx_prometheus_config}",
             f"-Djava.security.auth.login.config={self.paths.jaas}",
@@ -241,13 +279,17 @@ class Workload(WorkloadBase):
         }
         return pebble.Layer(layer_config)
 
+    @cached_property
+    def _layer_yaml(self) -> str:
+        """Returns the serialised Pebble layer, so it isn't dumped to YAML on every start."""
+        return self.layer.to_yaml()
+
     @staticmethod
     def map_env(env: Iterable[str]) -> dict[str, str]:
         """Parse env variables into a dict."""
         map_env = {}
         for var in env:
-            key = "".join(var.split("=", maxsplit=1)[0])
-            value = "".join(var.split("=", maxsplit=1)[1:])
+            key, _, value = var.partition("=")
             if key:
                 # only check for keys, as we can have an empty value for a variable
                 map_env[key] = value
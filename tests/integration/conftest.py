@@ -2,15 +2,21 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import hashlib
+import logging
 import os
 import random
 import string
+from pathlib import Path
 from typing import cast
 
 import pytest
-from helpers import DatabaseFixtureParams
+from helpers import JDBC_CONNECTOR_DOWNLOAD_LINK, DatabaseFixtureParams, download_file
+from jubilant import Juju
 from jubilant_adapters import JujuFixture, temp_model_fixture
 
+logger = logging.getLogger(__name__)
+
 
 def pytest_addoption(parser):
     """Defines pytest parsers."""
@@ -79,6 +85,30 @@ def integrator_charm(juju: JujuFixture):
     return charm
 
 
+@pytest.fixture(scope="session")
+def jdbc_plugin_path() -> str:
+    """Returns the path to the JDBC connectors plugin, downloaded once and reused across sessions."""
+    # use a directory readable by Juju, even when installed as a snap
+    cache_dir = Path(Juju()._temp_dir) / "connect-plugins"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    plugin_path = (
+        cache_dir / f"{hashlib.sha256(JDBC_CONNECTOR_DOWNLOAD_LINK.encode()).hexdigest()}.tar"
+    )
+
+    if plugin_path.exists():
+        logger.info(f"Using cached JDBC connectors from {plugin_path}")
+        return f"{plugin_path}"
+
+    logger.info(f"Downloading JDBC connectors from {JDBC_CONNECTOR_DOWNLOAD_LINK}...")
+    # download to a temporary name so an interrupted download is never picked up as cached
+    partial_path = plugin_path.with_suffix(".part")
+    download_file(JDBC_CONNECTOR_DOWNLOAD_LINK, f"{partial_path}")
+    partial_path.replace(plugin_path)
+    logger.info("Download finished successfully.")
+
+    return f"{plugin_path}"
+
+
 @pytest.fixture(scope="function")
 def mysql_test_data(juju: JujuFixture, request: pytest.FixtureRequest):
     """Loads a MySQL database with test data using the client shipped with MySQL charm.
@@ -179,12 +179,37 @@ def make_api_request(
 make_connect_api_request = make_api_request
 
 
+def connectors_running(juju: JujuFixture, worker: str | None = None) -> bool:
+    """Checks whether all connectors are in RUNNING state, optionally only on the `worker` host.
+
+    Returns False if there are no connectors or the Connect API is not reachable.
+    """
+    try:
+        status_resp = make_connect_api_request(
+            juju, endpoint="connectors?expand=status", verbose=False, timeout=10
+        )
+    except Exception:
+        return False
+
+    if status_resp.status_code != 200:
+        return False
+
+    # decode the payload only once, this is polled repeatedly
+    connectors = [item["status"]["connector"] for item in status_resp.json().values()]
+    return bool(connectors) and all(
+        connector["state"] == "RUNNING"
+        and (worker is None or connector["worker_id"].partition(":")[0] == worker)
+        for connector in connectors
+    )
+
+
 def download_file(url: str, dst_path: str):
     """Downloads a file from given `url` to `dst_path`."""
-    response = requests.get(url, stream=True)
-    with open(dst_path, mode="wb") as file:
-        for chunk in response.iter_content(chunk_size=10 * 1024):
-            file.write(chunk)
+    with requests.get(url, stream=True) as response:
+        response.raise_for_status()
+        with open(dst_path, mode="wb") as file:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                file.write(chunk)
 
 
 def build_mysql_db_init_queries(
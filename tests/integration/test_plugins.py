@@ -5,7 +5,6 @@ from helpers import (
     APP_NAME,
     IMAGE_RESOURCE_KEY,
     IMAGE_URI,
-    JDBC_CONNECTOR_DOWNLOAD_LINK,
     JDBC_SINK_CONNECTOR_CLASS,
     JDBC_SOURCE_CONNECTOR_CLASS,
     KAFKA_APP,
@@ -68,14 +67,10 @@ def test_build_and_deploy(juju: JujuFixture, kafka_connect_charm):
         )
 
 
-def test_add_plugin(juju: JujuFixture):
+def test_add_plugin(juju: JujuFixture, jdbc_plugin_path):
     """Checks attach-resource functionality using Aiven JDBC connector and ensures JDBC source/sink connector plugins are added."""
-    plugin_path = f"{Juju()._temp_dir}/jdbc-plugin.tar"
-    logging.info(f"Downloading JDBC connectors from {JDBC_CONNECTOR_DOWNLOAD_LINK}...")
-    download_file(JDBC_CONNECTOR_DOWNLOAD_LINK, plugin_path)
-    logging.info("Download finished successfully.")
     # attach resource
-    juju.cli("attach-resource", APP_NAME, f"{PLUGIN_RESOURCE_KEY}={plugin_path}")
+    juju.cli("attach-resource", APP_NAME, f"{PLUGIN_RESOURCE_KEY}={jdbc_plugin_path}")
 
     with juju.ext.fast_forward(fast_interval="60s"):
         juju.ext.model.wait_for_idle(apps=[APP_NAME], idle_period=30, timeout=600)
@@ -1,16 +1,13 @@
 import logging
-import tempfile
 
 import pytest
 from helpers import (
     APP_NAME,
     IMAGE_RESOURCE_KEY,
     IMAGE_URI,
-    JDBC_CONNECTOR_DOWNLOAD_LINK,
     JDBC_SOURCE_CONNECTOR_CLASS,
     KAFKA_APP,
     KAFKA_CHANNEL,
-    download_file,
     make_api_request,
     make_connect_api_request,
     search_secrets,
@@ -27,20 +24,16 @@ USERNAME_CACHE_KEY = "integrator-username"
 PASSWORD_CACHE_KEY = "integrator-password"
 
 
-def test_deploy_app_and_integrator(juju: JujuFixture, kafka_connect_charm, integrator_charm):
+def test_deploy_app_and_integrator(
+    juju: JujuFixture, kafka_connect_charm, integrator_charm, jdbc_plugin_path
+):
 
-    # download JDBC connector plugin and deploy the integrator charm with it.
-    with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_path = f"{temp_dir}/jdbc-plugin.tar"
-        logging.info(f"Downloading JDBC connectors from {JDBC_CONNECTOR_DOWNLOAD_LINK}...")
-        download_file(JDBC_CONNECTOR_DOWNLOAD_LINK, plugin_path)
-        logging.info("Download finished successfully.")
-
-        juju.ext.model.deploy(
-            integrator_charm,
-            application_name=INTEGRATOR_APP,
-            resources={PLUGIN_RESOURCE_KEY: plugin_path},
-        )
+    # deploy the integrator charm with the JDBC connector plugin.
+    juju.ext.model.deploy(
+        integrator_charm,
+        application_name=INTEGRATOR_APP,
+        resources={PLUGIN_RESOURCE_KEY: jdbc_plugin_path},
+    )
 
     # deploy kafka & kafka connect
     gather(
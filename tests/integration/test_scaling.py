@@ -1,20 +1,19 @@
 import logging
-import tempfile
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
 
+import jubilant
 import pytest
 from helpers import (
     APP_NAME,
     IMAGE_RESOURCE_KEY,
     IMAGE_URI,
-    JDBC_CONNECTOR_DOWNLOAD_LINK,
     KAFKA_APP,
     KAFKA_CHANNEL,
     MYSQL_APP,
     MYSQL_CHANNEL,
     DatabaseFixtureParams,
+    connectors_running,
     destroy_active_workers,
-    download_file,
     make_connect_api_request,
 )
 from jubilant_adapters import JujuFixture, gather
@@ -56,30 +55,26 @@ def test_build_and_deploy(juju: JujuFixture, kafka_connect_charm):
         ),
     )
 
-    juju.ext.model.add_relation(APP_NAME, KAFKA_APP)
+    # wait_for_idle below covers the relation settling, skip the adapter's per-relation polling
+    juju.integrate(APP_NAME, KAFKA_APP)
     with juju.ext.fast_forward(fast_interval="60s"):
         juju.ext.model.wait_for_idle(
             apps=[APP_NAME, KAFKA_APP, MYSQL_APP], idle_period=30, timeout=1800, status="active"
         )
 
 
-def test_deploy_integrator(juju: JujuFixture, integrator_charm):
+def test_deploy_integrator(juju: JujuFixture, integrator_charm, jdbc_plugin_path):
     """Deploys MySQL source integrator."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_path = f"{temp_dir}/jdbc-plugin.tar"
-        logging.info(f"Downloading JDBC connectors from {JDBC_CONNECTOR_DOWNLOAD_LINK}...")
-        download_file(JDBC_CONNECTOR_DOWNLOAD_LINK, plugin_path)
-        logging.info("Download finished successfully.")
-
-        juju.ext.model.deploy(
-            integrator_charm,
-            application_name=INTEGRATOR,
-            resources={PLUGIN_RESOURCE_KEY: plugin_path},
-            config={"mode": "source"},
-        )
+    juju.ext.model.deploy(
+        integrator_charm,
+        application_name=INTEGRATOR,
+        resources={PLUGIN_RESOURCE_KEY: jdbc_plugin_path},
+        config={"mode": "source"},
+    )
 
-    juju.ext.model.add_relation(INTEGRATOR, MYSQL_APP)
-    juju.ext.model.add_relation(INTEGRATOR, APP_NAME)
+    # both relations are independent, issue them back to back and let wait_for_idle settle them
+    juju.integrate(INTEGRATOR, MYSQL_APP)
+    juju.integrate(INTEGRATOR, APP_NAME)
 
     with juju.ext.fast_forward(fast_interval="60s"):
         juju.ext.model.wait_for_idle(
@@ -99,9 +94,11 @@ def test_load_data(juju: JujuFixture, mysql_test_data):
     logger.info("Loaded 93 records into source MySQL DB.")
 
     with juju.ext.fast_forward(fast_interval="30s"):
-        sleep(120)
-
-    assert "RUNNING" in juju.ext.model.applications[INTEGRATOR].status_message
+        juju.ext.model.block_until(
+            lambda: "RUNNING" in juju.ext.model.applications[INTEGRATOR].status_message,
+            timeout=120,
+            wait_period=5,
+        )
 
 
 def test_scale_out(juju: JujuFixture):
@@ -118,10 +115,19 @@ def test_scale_out(juju: JujuFixture):
             wait_period=15,
         )
 
-    for unit in juju.ext.model.applications[APP_NAME].units:
-        status_resp = make_connect_api_request(
-            juju, unit=unit, endpoint="connectors?expand=status"
+    # every worker should report the same cluster-wide status, query them concurrently
+    units = juju.ext.model.applications[APP_NAME].units
+    with ThreadPoolExecutor(max_workers=len(units)) as executor:
+        responses = list(
+            executor.map(
+                lambda unit: make_connect_api_request(
+                    juju, unit=unit, endpoint="connectors?expand=status"
+                ),
+                units,
+            )
         )
+
+    for status_resp in responses:
         assert status_resp.status_code == 200
         status_json = status_resp.json()
         for connector in status_json:
@@ -137,24 +143,22 @@ def test_destroy_active_workers(juju: JujuFixture):
     for _ in range(5):
         destroy_active_workers(juju)
 
+        # survivors might still report the killed worker's connectors as RUNNING right after
+        # the deletion, require consecutive successes so the cluster has time to rebalance
         with juju.ext.fast_forward(fast_interval="60s"):
-            juju.ext.model.wait_for_idle(
-                apps=[INTEGRATOR, APP_NAME],
-                idle_period=30,
+            juju.wait(
+                lambda status: jubilant.all_active(status, APP_NAME) and connectors_running(juju),
+                delay=10,
+                successes=3,
                 timeout=600,
-                status="active",
-                raise_on_error=False,
             )
 
-    logging.info("Sleeping for two minutes...")
-    with juju.ext.fast_forward(fast_interval="30s"):
-        sleep(120)
-
     # assert the task is RUNNING after the mayhem!
     status_resp = make_connect_api_request(juju, endpoint="connectors?expand=status")
-    assert {item["status"]["connector"]["state"] for item in status_resp.json().values()} == {
-        "RUNNING"
-    }
+    assert status_resp.status_code == 200
+    connectors = [item["status"]["connector"] for item in status_resp.json().values()]
+    assert connectors
+    assert all(connector["state"] == "RUNNING" for connector in connectors)
 
     # scale down to 1 unit
     juju.ext.model.applications[APP_NAME].scale(scale=1)
@@ -166,20 +170,25 @@ def test_destroy_active_workers(juju: JujuFixture):
         wait_for_exact_units=1,
     )
 
-    logging.info("Sleeping for two minutes...")
-    with juju.ext.fast_forward(fast_interval="30s"):
-        sleep(120)
-
-    status_resp = make_connect_api_request(juju, endpoint="connectors?expand=status")
-    assert {item["status"]["connector"]["state"] for item in status_resp.json().values()} == {
-        "RUNNING"
-    }
-
-    # assert the task is running on the remaining pod
     remaining_unit = juju.ext.model.applications[APP_NAME].units[0]
     parts = remaining_unit.name.split("/")
     unit_name, unit_id = parts
-    assert {
-        item["status"]["connector"]["worker_id"].split(":")[0]
-        for item in status_resp.json().values()
-    } == {f"{unit_name}-{unit_id}.{APP_NAME}-endpoints"}
+    expected_endpoint = f"{unit_name}-{unit_id}.{APP_NAME}-endpoints"
+
+    # wait for the connectors to be rescheduled on the remaining pod
+    with juju.ext.fast_forward(fast_interval="30s"):
+        juju.ext.model.block_until(
+            lambda: connectors_running(juju, worker=expected_endpoint),
+            timeout=600,
+            wait_period=5,
+        )
+
+    # assert the task is RUNNING on the remaining pod, parsing the status only once
+    status_resp = make_connect_api_request(juju, endpoint="connectors?expand=status")
+    connectors = [item["status"]["connector"] for item in status_resp.json().values()]
+    assert connectors
+    assert all(
+        connector["state"] == "RUNNING"
+        and connector["worker_id"].partition(":")[0] == expected_endpoint
+        for connector in connectors
+    )
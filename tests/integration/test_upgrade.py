@@ -43,18 +43,22 @@ def test_in_place_upgrade(juju: JujuFixture, kafka_connect_charm):
         ),
     )
 
-    juju.ext.model.wait_for_idle(apps=[APP_NAME, KAFKA_APP], timeout=3000)
     juju.ext.model.add_relation(APP_NAME, KAFKA_APP)
 
     with juju.ext.fast_forward(fast_interval="60s"):
         juju.ext.model.wait_for_idle(
-            apps=[APP_NAME, KAFKA_APP], idle_period=60, timeout=1200, status="active"
+            apps=[APP_NAME, KAFKA_APP], idle_period=60, timeout=3000, status="active"
         )
 
-    leader_unit = None
-    for unit in juju.ext.model.applications[APP_NAME].units:
-        if unit.is_leader_from_status():
-            leader_unit = unit
+    # units are built from a single status call, no need to query each of them
+    leader_unit = next(
+        (
+            unit
+            for unit in juju.ext.model.applications[APP_NAME].units
+            if unit.is_leader_from_status()
+        ),
+        None,
+    )
     assert leader_unit
 
     logger.info("Calling pre-upgrade-check...")
@@ -3,8 +3,10 @@
 # See LICENSE file for licensing details.
 
 from collections import defaultdict
+from functools import cache
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pytest
 import yaml
@@ -22,76 +24,84 @@ from src.literals import (
     SUBSTRATE,
 )
 
-CONFIG = yaml.safe_load(Path("./config.yaml").read_text())
-ACTIONS = yaml.safe_load(Path("./actions.yaml").read_text())
-METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
+# prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@cache
+def load_yaml(path: str) -> dict:
+    """Parses a YAML file once per session."""
+    return yaml.load(Path(path).read_text(), Loader=YAML_LOADER)
+
+
+CONFIG = load_yaml("./config.yaml")
+ACTIONS = load_yaml("./actions.yaml")
+METADATA = load_yaml("./metadata.yaml")
+
+KAFKA_CLIENT_REL_DATA = {
+    "username": "username",
+    "password": "password",
+    "tls": "disabled",
+    "tls-ca": "disabled",
+    "endpoints": "10.10.10.10:9092,10.10.10.11:9092",
+}
+PLUGIN_RESOURCE = Resource(name=PLUGIN_RESOURCE_KEY, path="./tests/unit/resources/FakePlugin.tar")
+
+
+def _k8s_base_state() -> State:
+    return State(
+        leader=True,
+        containers=[
+            Container(
+                name=CONTAINER,
+                can_connect=True,
+                service_statuses={SERVICE_NAME: ServiceStatus.ACTIVE},
+            )
+        ],
+        relations=[PeerRelation(PEER_REL, PEER_REL), PeerRelation("restart", "rolling_op")],
+    )
 
 
-@pytest.fixture(autouse=True)
-def workload(monkeypatch):
-    """Workload with completely mocked functionality."""
-    monkeypatch.setattr("workload.Workload.exec", Mock())
-    monkeypatch.setattr("workload.Workload.installed", True)
-    monkeypatch.setattr("workload.Workload.write", Mock())
-    monkeypatch.setattr("workload.Workload.remove", Mock())
-    monkeypatch.setattr("workload.Workload.ls", Mock(return_value=[]))
-    yield
+def _vm_base_state() -> State:
+    return State(leader=True)
+
+
+# SUBSTRATE is fixed for the whole run, so the builder is picked once at import time
+build_base_state = _k8s_base_state if SUBSTRATE == "k8s" else _vm_base_state
 
 
 @pytest.fixture()
 def workload_with_io(monkeypatch, tmp_path_factory):
     """Workload with simulated read/write functionality using temp paths."""
 
+    # Paths exposes plain strings, which also end up in the serialised Pebble layer
     class TmpPaths(Paths):
-        logs_dir = tmp_path_factory.mktemp("logs")
-        snap_dir = tmp_path_factory.mktemp("snap")
-        env = tmp_path_factory.mktemp("etc") / "environment"
-        plugins = tmp_path_factory.mktemp("plugins")
+        logs_dir = f"{tmp_path_factory.mktemp('logs')}"
+        snap_dir = f"{tmp_path_factory.mktemp('snap')}"
+        env = f"{tmp_path_factory.mktemp('etc') / 'environment'}"
+        plugins = f"{tmp_path_factory.mktemp('plugins')}"
 
-    paths = TmpPaths(config_dir=tmp_path_factory.mktemp("config"))
+    paths = TmpPaths(config_dir=f"{tmp_path_factory.mktemp('config')}")
 
     monkeypatch.setattr(
         "workload.Workload.write", lambda _, content, path: open(path, "w").write(content)
     )
     monkeypatch.setattr(
         "workload.Workload.read",
-        lambda _, path: open(path, "r").read().split("\n") if Path(path).exists() else [],
+        lambda _, path: open(path, "r").read().splitlines() if Path(path).exists() else [],
     )
     monkeypatch.setattr("workload.Workload.paths", paths)
     yield
 
 
-@pytest.fixture(autouse=True)
-def patched_snap(monkeypatch):
-    cache = Mock()
-    snap_mock = Mock()
-    snap_mock.services = defaultdict(default_factory=lambda _: {"active": True})
-    cache.return_value = {SNAP_NAME: snap_mock}
-    with monkeypatch.context() as m:
-        m.setattr("charms.operator_libs_linux.v2.snap.SnapCache", cache)
-        yield
-
-
-@pytest.fixture(autouse=True)
-def tenacity_wait():
-    with patch("tenacity.nap.time") as patched_nap:
-        yield patched_nap
-
-
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def kafka_client_rel():
-    return {
-        "username": "username",
-        "password": "password",
-        "tls": "disabled",
-        "tls-ca": "disabled",
-        "endpoints": "10.10.10.10:9092,10.10.10.11:9092",
-    }
+    return KAFKA_CLIENT_REL_DATA
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def plugin_resource():
-    return Resource(name=PLUGIN_RESOURCE_KEY, path="./tests/unit/resources/FakePlugin.tar")
+    return PLUGIN_RESOURCE
 
 
 class MockAcquireLock(EventBase):
@@ -108,46 +118,64 @@ class MockAcquireLock(EventBase):
         self.callback_override = snapshot["callback_override"]
 
 
-@pytest.fixture
-def restart_rel(monkeypatch):
+@pytest.fixture(autouse=True)
+def patched_dependencies(monkeypatch):
+    """Mocks the workload, snap and rolling-ops lock in a single setup."""
+    # workload with completely mocked functionality
+    monkeypatch.setattr("workload.Workload.exec", Mock())
+    monkeypatch.setattr("workload.Workload.installed", True)
+    monkeypatch.setattr("workload.Workload.write", Mock())
+    monkeypatch.setattr("workload.Workload.remove", Mock())
+    monkeypatch.setattr("workload.Workload.ls", Mock(return_value=[]))
+
+    snap_mock = Mock()
+    snap_mock.services = defaultdict(lambda: {"active": True})
+    monkeypatch.setattr(
+        "charms.operator_libs_linux.v2.snap.SnapCache", lambda *_, **__: {SNAP_NAME: snap_mock}
+    )
+
     monkeypatch.setattr("charms.rolling_ops.v0.rollingops.AcquireLock", MockAcquireLock)
 
+
+@pytest.fixture(autouse=True)
+def tenacity_wait():
+    # kept off the test's monkeypatch, some tests call monkeypatch.undo() midway
+    with pytest.MonkeyPatch.context() as m:
+        # swap only tenacity's reference to the time module, time.sleep stays untouched elsewhere
+        m.setattr("tenacity.nap.time", SimpleNamespace(sleep=lambda _: None))
+        yield
+
+
+@pytest.fixture
+def restart_rel():
     return PeerRelation("restart", "rolling_op")
 
 
-@pytest.fixture(scope="module")
-def active_service():
+@pytest.fixture(scope="session")
+def active_service_mocks() -> tuple[Mock, Mock]:
     mock_response = MagicMock()
     mock_response.json.return_value = {}
 
-    with (
-        patch(
-            "managers.connect.ConnectManager.health_check", return_value=True
-        ) as patched_service,
-        patch("managers.connect.ConnectManager._request", return_value=mock_response),
-    ):
-        yield patched_service
+    return Mock(return_value=True), Mock(return_value=mock_response)
+
+
+@pytest.fixture
+def active_service(monkeypatch, active_service_mocks):
+    # applied per test, ConnectManager tests exercise the real health check and requests
+    health_check, request = active_service_mocks
+    health_check.reset_mock()
+    request.reset_mock()
+    monkeypatch.setattr("managers.connect.ConnectManager.health_check", health_check)
+    monkeypatch.setattr("managers.connect.ConnectManager._request", request)
+
+    return health_check
 
 
 @pytest.fixture()
-def base_state(restart_rel):
-    peer_rel = PeerRelation(PEER_REL, PEER_REL)
-    if SUBSTRATE == "k8s":
-        state = State(
-            leader=True,
-            containers=[
-                Container(
-                    name=CONTAINER,
-                    can_connect=True,
-                    service_statuses={SERVICE_NAME: ServiceStatus.ACTIVE},
-                )
-            ],
-            relations=[peer_rel, restart_rel],
-        )
-    else:
-        state = State(leader=True)
-
-    return state
+def base_state():
+    # running an event writes to the input relation databags in place, and copying a State
+    # reuses them, so every test gets a freshly built one
+    return build_base_state()
 
 
 @pytest.fixture()
@@ -4,6 +4,7 @@
 
 import dataclasses
 import logging
+from types import SimpleNamespace
 from typing import cast
 from unittest.mock import MagicMock, patch
 
@@ -11,10 +12,15 @@ import pytest
 from ops.testing import Context, Relation, State
 from src.charm import ConnectCharm
 from src.core.models import PeerWorkersContext
-from src.literals import KAFKA_CLIENT_REL, SUBSTRATE, Status
+from src.literals import KAFKA_CLIENT_REL, PEER_REL, SUBSTRATE, Status
+
+from managers.connect import ConnectManager
 
 logger = logging.getLogger(__name__)
 
+# the unit fixtures mock the health check out on the class, keep hold of the real implementation
+REAL_HEALTH_CHECK = vars(ConnectManager)["health_check"]
+
 
 @pytest.mark.skipif(SUBSTRATE == "k8s", reason="snap not used on K8s")
 def test_install_blocks_snap_install_failure(ctx: Context, base_state: State) -> None:
@@ -161,3 +167,100 @@ def test_enable_auth(
         assert secret_contents.get(PeerWorkersContext.ADMIN_PASSWORD) == admin_password
     else:
         assert secret_contents.get(PeerWorkersContext.ADMIN_PASSWORD, "")
+
+
+def test_unchanged_config_does_not_trigger_restart(
+    ctx: Context, base_state: State, kafka_client_rel: dict, active_service
+) -> None:
+    """Checks a config-changed with already rendered worker properties does not restart the service."""
+    # Given
+    kafka_rel = Relation(KAFKA_CLIENT_REL, KAFKA_CLIENT_REL, remote_app_data=kafka_client_rel)
+    state_in = dataclasses.replace(base_state, relations=[*base_state.relations, kafka_rel])
+
+    with patch("workload.Workload.read"), patch("workload.Workload.restart"):
+        state_configured = ctx.run(ctx.on.config_changed(), state_in)
+
+    # When
+    with (
+        patch("workload.Workload.read"),
+        patch("ops.Container.exists", return_value=True),
+        patch("workload.Workload.restart") as _restart,
+    ):
+        state_out = ctx.run(ctx.on.config_changed(), state_configured)
+
+    # Then
+    assert not _restart.call_count
+    assert state_out.unit_status == Status.ACTIVE.value.status
+
+
+def test_missing_worker_properties_trigger_restart(
+    ctx: Context, base_state: State, kafka_client_rel: dict, active_service
+) -> None:
+    """Checks worker properties are rendered again if missing, even though the stored hash matches."""
+    # Given
+    kafka_rel = Relation(KAFKA_CLIENT_REL, KAFKA_CLIENT_REL, remote_app_data=kafka_client_rel)
+    state_in = dataclasses.replace(base_state, relations=[*base_state.relations, kafka_rel])
+
+    with patch("workload.Workload.read"), patch("workload.Workload.restart"):
+        state_configured = ctx.run(ctx.on.config_changed(), state_in)
+
+    # When
+    with (
+        patch("workload.Workload.read"),
+        patch("ops.Container.exists", return_value=False),
+        patch("managers.config.ConfigManager.configure") as _configure,
+        patch("workload.Workload.restart") as _restart,
+    ):
+        state_out = ctx.run(ctx.on.config_changed(), state_configured)
+
+    # Then
+    assert _configure.call_count == 1
+    assert _restart.call_count == 1
+    assert state_out.unit_status == Status.ACTIVE.value.status
+
+
+def test_unhealthy_worker_keeps_restart_pending(
+    ctx: Context,
+    base_state: State,
+    kafka_client_rel: dict,
+    active_service,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Checks the restart stays pending if the worker never becomes healthy after a restart."""
+    # Given
+    kafka_rel = Relation(KAFKA_CLIENT_REL, KAFKA_CLIENT_REL, remote_app_data=kafka_client_rel)
+    state_in = dataclasses.replace(base_state, relations=[*base_state.relations, kafka_rel])
+    # advance a fake clock on every backoff, so the time bound is reached without waiting
+    clock = SimpleNamespace(now=0.0)
+    fake_time = SimpleNamespace(
+        monotonic=lambda: clock.now,
+        sleep=lambda seconds: setattr(clock, "now", clock.now + seconds),
+    )
+    caplog.set_level(logging.WARNING)
+
+    # When
+    with (
+        patch("workload.Workload.read"),
+        patch("workload.Workload.restart") as _restart,
+        patch("tenacity.time", fake_time),
+        patch("tenacity.nap.time", fake_time),
+        # exercise the real health check, including its own retries
+        patch("managers.connect.ConnectManager.health_check", REAL_HEALTH_CHECK),
+        patch(
+            "managers.connect.ConnectManager.ping_connect_api",
+            return_value=MagicMock(status_code=503),
+        ) as _ping,
+        # runs a health check of its own after the restart
+        patch("events.connect.ConnectHandler._update_status", autospec=True),
+    ):
+        state_out = ctx.run(ctx.on.config_changed(), state_in)
+
+    # Then
+    worker_rel = next(rel for rel in state_out.relations if rel.endpoint == PEER_REL)
+    assert _restart.call_count == 1
+    assert worker_rel.local_unit_data.get("restart") == "true"
+    # 3 health checks of 5 pings 3s apart, with 1s and 2s of backoff in between, the next
+    # 4s backoff would start a 4th check after the 38s bound
+    assert _ping.call_count == 15
+    assert clock.now == 39
+    assert "Worker service is not healthy after restart." in caplog.messages
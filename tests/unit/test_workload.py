@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ops import CharmBase
+from ops.testing import Container, Context, Exec, State
+from src.literals import CONTAINER
+
+from workload import Workload
+
+logger = logging.getLogger(__name__)
+
+# the unit fixtures mock most of these out on the class, keep hold of the real implementations
+REAL_METHODS = {name: vars(Workload)[name] for name in ("read", "write", "exec", "remove")}
+PROPERTIES = Workload.paths.worker_properties
+
+
+@pytest.fixture()
+def container_workload(monkeypatch):
+    """A Workload instance on a simulated container, with real file I/O and exec."""
+    for name, method in REAL_METHODS.items():
+        monkeypatch.setattr(Workload, name, method)
+
+    # a bare charm, so nothing but the test touches the container
+    ctx = Context(CharmBase, meta={"name": "workload-test", "containers": {CONTAINER: {}}})
+    state = State(containers=[Container(name=CONTAINER, can_connect=True, execs={Exec(["rm"])})])
+    with ctx(ctx.on.update_status(), state) as mgr:
+        yield Workload(container=mgr.charm.unit.get_container(CONTAINER))
+
+
+@pytest.fixture()
+def mock_workload(monkeypatch) -> Workload:
+    """A Workload instance on a mock container, with the real `remove` implementation."""
+    monkeypatch.setattr(Workload, "remove", REAL_METHODS["remove"])
+    return Workload(container=MagicMock())
+
+
+def test_read_is_cached(container_workload: Workload) -> None:
+    """Checks repeated reads of the same file only pull it from the container once."""
+    container_workload.write(content="a=1\nb=2", path=PROPERTIES)
+
+    with patch.object(
+        container_workload.container, "pull", wraps=container_workload.container.pull
+    ) as _pull:
+        first = container_workload.read(PROPERTIES)
+        second = container_workload.read(PROPERTIES)
+
+    assert first == second == ["a=1", "b=2"]
+    assert _pull.call_count == 1
+
+
+def test_read_returns_copy(container_workload: Workload) -> None:
+    """Checks callers mutating the returned lines do not alter the cached content."""
+    container_workload.write(content="a=1", path=PROPERTIES)
+
+    container_workload.read(PROPERTIES).append("b=2")
+
+    assert container_workload.read(PROPERTIES) == ["a=1"]
+
+
+def test_write_invalidates_cached_read(container_workload: Workload) -> None:
+    """Checks a write through the workload is picked up by the next read."""
+    container_workload.write(content="a=1", path=PROPERTIES)
+    assert container_workload.read(PROPERTIES) == ["a=1"]
+
+    container_workload.write(content="a=2", path=PROPERTIES)
+
+    assert container_workload.read(PROPERTIES) == ["a=2"]
+
+
+def test_missing_file_is_cached_as_empty(container_workload: Workload) -> None:
+    """Checks a missing file reads as empty, is cached, and is picked up once written."""
+    with patch.object(
+        container_workload.container, "pull", wraps=container_workload.container.pull
+    ) as _pull:
+        assert container_workload.read(PROPERTIES) == []
+        assert container_workload.read(PROPERTIES) == []
+
+    assert _pull.call_count == 1
+
+    container_workload.write(content="a=1", path=PROPERTIES)
+
+    assert container_workload.read(PROPERTIES) == ["a=1"]
+
+
+def test_exec_and_invalidate_cache_drop_cached_reads(container_workload: Workload) -> None:
+    """Checks changes made behind the workload's back are seen after an exec or invalidation."""
+    container_workload.write(content="a=1", path=PROPERTIES)
+    assert container_workload.read(PROPERTIES) == ["a=1"]
+
+    # not going through the workload, so the cached content is stale
+    container_workload.container.push(PROPERTIES, "a=2")
+    assert container_workload.read(PROPERTIES) == ["a=1"]
+
+    container_workload.exec(["rm", "-f", "/tmp/unrelated"])
+    assert container_workload.read(PROPERTIES) == ["a=2"]
+
+    container_workload.container.push(PROPERTIES, "a=3")
+    container_workload.invalidate_cache(PROPERTIES)
+    assert container_workload.read(PROPERTIES) == ["a=3"]
+
+
+def test_remove_without_glob_runs_single_rm(mock_workload: Workload) -> None:
+    """Checks plain paths are removed with a single `rm` and no shell."""
+    with patch.object(mock_workload, "exec") as _exec:
+        mock_workload.remove("/etc/connect/a.pem", "/etc/connect/b.pem")
+
+    _exec.assert_called_once_with(["rm", "/etc/connect/a.pem", "/etc/connect/b.pem"])
+
+
+def test_remove_glob_multiple_paths(mock_workload: Workload) -> None:
+    """Checks all glob patterns are expanded by a single shell command."""
+    with patch.object(mock_workload, "exec") as _exec:
+        mock_workload.remove("/etc/connect/*.pem", "/etc/connect/*.p12", glob=True)
+
+    _exec.assert_called_once_with(["sh", "-c", "rm -rf -- /etc/connect/*.pem /etc/connect/*.p12"])
+
+
+def test_remove_glob_quotes_directory(mock_workload: Workload) -> None:
+    """Checks the directory is shell-quoted while the pattern is left for the shell to expand."""
+    with patch.object(mock_workload, "exec") as _exec:
+        mock_workload.remove("/etc/my connect/$(reboot)/*.pem", glob=True)
+
+    _exec.assert_called_once_with(["sh", "-c", "rm -rf -- '/etc/my connect/$(reboot)'/*.pem"])
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/etc/connect/*.pem; reboot",
+        "/etc/connect/$(reboot)",
+        "/etc/connect/*.pem && rm -rf /",
+        "/etc/connect/`id`",
+        "/etc/connect/a b",
+        "/etc/connect/",
+        "*.pem",
+        "connect/*.pem",
+        "/*.pem",
+    ],
+)
+def test_remove_glob_rejects_unsafe_pattern(mock_workload: Workload, path: str) -> None:
+    """Checks an unsafe path anywhere in the call is rejected before anything runs."""
+    with patch.object(mock_workload, "exec") as _exec, pytest.raises(ValueError):
+        mock_workload.remove("/etc/connect/*.jks", path, glob=True)
+
+    _exec.assert_not_called()